@@ -0,0 +1,80 @@
+"""Pure-Python rendering of Notion blocks to indented text.
+
+This module is the per-block hot loop and deliberately contains no I/O —
+just typed dict traversal — so it can be AOT-compiled with mypyc
+(`mypyc block_format.py`). When the compiled extension is present on the
+path it is imported in place of this file automatically; otherwise the
+interpreted version is used.
+"""
+
+from typing import Any, Callable, Dict
+
+# Precomputed indent strings so nested blocks reuse one cached object per
+# depth instead of allocating "  " * indent on every call
+_INDENTS = tuple("  " * i for i in range(32))
+
+
+def indent_str_for(indent: int) -> str:
+    return _INDENTS[indent] if indent < 32 else "  " * indent
+
+
+def join_rich_text(content: Dict[str, Any], key: str = "rich_text") -> str:
+    """Join the plain_text of a rich_text (or caption) array; the generator
+    avoids materializing a throwaway list per block"""
+    return "".join(t.get("plain_text", "") for t in content.get(key, ()))
+
+
+def _format_image(content: Dict[str, Any], indent_str: str) -> str:
+    caption = join_rich_text(content, "caption")
+    url = ""
+    if "file" in content:
+        url = content["file"].get("url", "")
+    elif "external" in content:
+        url = content["external"].get("url", "")
+
+    caption_text = f" - {caption}" if caption else ""
+    return f"{indent_str}[Image{caption_text}]({url})"
+
+
+# Most block types are just "indent + prefix + rich_text"; precompiled
+# %-templates cover those with a single C-level format call per block
+_TEMPLATES: Dict[str, str] = {
+    "paragraph": "%s%s",
+    "heading_1": "%s# %s",
+    "heading_2": "%s## %s",
+    "heading_3": "%s### %s",
+    "bulleted_list_item": "%s• %s",
+    # Simplified, won't have proper numbering
+    "numbered_list_item": "%s1. %s",
+    "toggle": "%s▶ %s",
+    "quote": "%s> %s",
+}
+
+# Formatters for the block types that need more than a template, resolved
+# with a single dict lookup instead of walking an if/elif chain
+_FORMATTERS: Dict[str, Callable[[Dict[str, Any], str], str]] = {
+    "to_do": lambda c, i: f"{i}{'✓' if c.get('checked', False) else '☐'} {join_rich_text(c)}",
+    "code": lambda c, i: f"{i}```{c.get('language', '')}\n{i}{join_rich_text(c)}\n{i}```",
+    "image": _format_image,
+    "divider": lambda c, i: f"{i}---",
+    "callout": lambda c, i: f"{i}{c.get('icon', {}).get('emoji', '')} | {join_rich_text(c)}",
+    "table": lambda c, i: f"{i}[Table - use get_table_content to view]",
+}
+
+
+def format_block_text(block: Dict[str, Any], indent: int) -> str:
+    """Render a single block (excluding its children) as indented text"""
+    block_type = block.get("type")
+    indent_str = indent_str_for(indent)
+
+    if not block_type or block_type not in block:
+        return f"{indent_str}[Unsupported block type: {block_type}]"
+
+    content = block[block_type]
+
+    tpl = _TEMPLATES.get(block_type)
+    if tpl is not None:
+        return tpl % (indent_str, join_rich_text(content))
+
+    fn = _FORMATTERS.get(block_type)
+    return fn(content, indent_str) if fn else f"{indent_str}[{block_type} block]"
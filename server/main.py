@@ -1,10 +1,47 @@
 from mcp.server.fastmcp import FastMCP, Context
+import asyncio
 import httpx
+import io
+import orjson
 import os
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, Tuple
+from async_lru import alru_cache
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 import logging
 
+from block_format import format_block_text, indent_str_for, join_rich_text
+
+# Route plain json.dumps/json.loads calls through orjson (same autoswap
+# idea Azure Functions applies when orjson is installed). The MCP stack
+# serializes most JSON-RPC frames via pydantic-core, but anything in the
+# process that uses stdlib json without custom kwargs gets the faster
+# parser; calls with kwargs orjson can't honor fall back to the originals.
+import json as _stdlib_json
+
+_stdlib_dumps = _stdlib_json.dumps
+_stdlib_loads = _stdlib_json.loads
+
+
+def _orjson_dumps(obj, *args, **kwargs):
+    if args or kwargs:
+        return _stdlib_dumps(obj, *args, **kwargs)
+    try:
+        # orjson returns bytes; stdlib callers expect str
+        return orjson.dumps(obj).decode("utf-8")
+    except TypeError:
+        return _stdlib_dumps(obj)
+
+
+def _orjson_loads(s, *args, **kwargs):
+    if args or kwargs:
+        return _stdlib_loads(s, *args, **kwargs)
+    return orjson.loads(s)
+
+
+_stdlib_json.dumps = _orjson_dumps
+_stdlib_json.loads = _orjson_loads
+
 # Load environment variables from .env file if available
 # This allows fallback to .env but prioritizes environment variables
 load_dotenv()
@@ -18,16 +55,62 @@ if not NOTION_API_KEY:
     print("WARNING: NOTION_API_KEY environment variable is not set.")
     print("Please provide it when registering this server with your MCP client.")
 
+# Raise on non-2xx responses centrally instead of per-call status checks.
+# Bodies are read eagerly for anything raise_for_status will reject —
+# including 1xx/3xx, not just 4xx/5xx — so handlers can use response.text.
+async def _raise_on_error(response: httpx.Response) -> None:
+    if not response.is_success:
+        await response.aread()
+    response.raise_for_status()
+
+
+# Shared HTTP client for all Notion API calls. Reusing one client keeps
+# connections to api.notion.com alive between tool calls (no TCP/TLS
+# handshake per request) and HTTP/2 lets concurrent requests multiplex
+# over a single connection. Authorization is injected per-call via
+# get_headers() so the key can still be rotated by check_api_key.
+_client = httpx.AsyncClient(
+    http2=True,
+    timeout=httpx.Timeout(30.0),
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+    headers={"Notion-Version": NOTION_VERSION},
+    event_hooks={"response": [_raise_on_error]},
+)
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP):
+    try:
+        yield
+    finally:
+        await _client.aclose()
+
+
 # Create MCP server
-mcp = FastMCP("Notion Explorer", dependencies=["httpx", "python-dotenv"])
+mcp = FastMCP(
+    "Notion Explorer",
+    dependencies=["async-lru", "httpx[http2]", "orjson", "python-dotenv"],
+    lifespan=_lifespan,
+)
 logger = logging.getLogger(__name__)
 
+
+# Parse responses with orjson instead of httpx's stdlib-based .json() —
+# much faster on the large block listings Notion returns, and works
+# directly on the raw bytes without an intermediate str
+def _parse(response: httpx.Response) -> Any:
+    return orjson.loads(response.content)
+
 # Function to check API key on each request
 def check_api_key(ctx: Context) -> None:
     """Check if API key is set before each request"""
     global NOTION_API_KEY
-    # Get the latest environment version of the key (in case it was passed to the server)
-    NOTION_API_KEY = os.getenv("NOTION_API_KEY")
+    # The key is read once at import; only fall back to os.environ while it
+    # is still unset (covers the client injecting it after startup) instead
+    # of walking the environment on every tool call. Rotations go through
+    # the reload_api_key tool.
+    if not NOTION_API_KEY:
+        NOTION_API_KEY = os.getenv("NOTION_API_KEY")
     if not NOTION_API_KEY:
         ctx.error(
             "NOTION_API_KEY environment variable is not set. Please set it before making API calls."
@@ -35,13 +118,38 @@ def check_api_key(ctx: Context) -> None:
         raise ValueError("NOTION_API_KEY environment variable is not set")
 
 
-# Base headers for Notion API requests
+@mcp.tool()
+async def reload_api_key(ctx: Context = None) -> str:
+    """
+    Re-read NOTION_API_KEY from the environment after a key rotation.
+
+    Returns:
+        A confirmation message
+    """
+    global NOTION_API_KEY
+    NOTION_API_KEY = os.getenv("NOTION_API_KEY")
+    if not NOTION_API_KEY:
+        return "NOTION_API_KEY environment variable is not set"
+    return "API key reloaded"
+
+
+# Base headers for Notion API requests, rebuilt only when the key rotates.
+# httpx never mutates the headers dict we pass, so every call can share
+# the same object instead of allocating a fresh one per request.
+_HEADERS_CACHE = {"key": None, "headers": None}
+
+
 def get_headers():
-    return {
-        "Authorization": f"Bearer {NOTION_API_KEY}",
-        "Content-Type": "application/json",
-        "Notion-Version": NOTION_VERSION,
-    }
+    key = NOTION_API_KEY
+    cache = _HEADERS_CACHE
+    if cache["key"] is not key:
+        cache["headers"] = {
+            "Authorization": f"Bearer {key}",
+            "Content-Type": "application/json",
+            "Notion-Version": NOTION_VERSION,
+        }
+        cache["key"] = key
+    return cache["headers"]
 
 
 @mcp.tool()
@@ -49,18 +157,20 @@ async def search_notion_pages(
     query: Optional[str] = None,
     filter_type: Optional[str] = None,
     page_size: int = 10,
+    cursor: Optional[str] = None,
     ctx: Context = None,
 ) -> str:
     # Check for API key
     check_api_key(ctx)
     """
     Search for pages and databases in Notion.
-    
+
     Args:
         query: Optional search term to find specific pages/databases
         filter_type: Optional filter - can be "page" or "database" to limit results
         page_size: Number of results to return (max 100)
-    
+        cursor: Optional pagination cursor from a previous call's next_cursor line
+
     Returns:
         A formatted string with search results
     """
@@ -77,400 +187,350 @@ async def search_notion_pages(
     if filter_type and filter_type in ["page", "database"]:
         payload["filter"] = {"value": filter_type, "property": "object"}
 
+    # Resume from a previous page of results rather than re-fetching them
+    if cursor:
+        payload["start_cursor"] = cursor
+
     # Sort by recently edited first
     payload["sort"] = {"direction": "descending", "timestamp": "last_edited_time"}
-    print("payload", payload)
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, headers=get_headers(), json=payload)
-        print(response.json())
-        if response.status_code != 200:
-            return f"Error: {response.status_code} - {response.text}"
-
-        data = response.json()
-        results = data.get("results", [])
-
-        if not results:
-            return "No results found"
-
-        # Format the results
-        output = []
-        for item in results:
-            item_id = item.get("id", "Unknown ID")
-            item_type = item.get("object", "unknown")
-
-            # Get title/name from appropriate property based on type
-            title = "Untitled"
-            if item_type == "page":
-                # Handle both page formats (with properties or with just title)
-                if "properties" in item and "title" in item["properties"]:
-                    title_parts = item["properties"]["title"].get("title", [])
-                    if title_parts:
-                        title = "".join(
-                            [part.get("plain_text", "") for part in title_parts]
-                        )
-                elif "title" in item:
-                    title_parts = item["title"]
-                    if title_parts:
-                        title = "".join(
-                            [part.get("plain_text", "") for part in title_parts]
-                        )
-            elif item_type == "database":
-                if "title" in item:
-                    title_parts = item["title"]
-                    if title_parts:
-                        title = "".join(
-                            [part.get("plain_text", "") for part in title_parts]
-                        )
-
-            url = item.get("url", "No URL")
-            last_edited = item.get("last_edited_time", "Unknown")
-
-            output.append(
-                f"- {title} ({item_type})\n  ID: {item_id}\n  URL: {url}\n  Last Edited: {last_edited}"
-            )
+    try:
+        response = await _client.post(
+            url, headers=get_headers(), content=orjson.dumps(payload)
+        )
+    except httpx.HTTPStatusError as e:
+        return f"Error: {e.response.status_code} - {e.response.text}"
+
+    data = _parse(response)
+    # Guarded so production runs skip the repr of a potentially large body
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("search payload: %s, response: %s", payload, data)
+    results = data.get("results", [])
+
+    if not results:
+        return "No results found"
+
+    # Format the results
+    output = []
+    for item in results:
+        item_id = item.get("id", "Unknown ID")
+        item_type = item.get("object", "unknown")
+
+        # Get title/name from appropriate property based on type
+        title = "Untitled"
+        if item_type == "page":
+            # Handle both page formats (with properties or with just title)
+            if "properties" in item and "title" in item["properties"]:
+                title_parts = item["properties"]["title"].get("title", [])
+                if title_parts:
+                    title = "".join(
+                        [part.get("plain_text", "") for part in title_parts]
+                    )
+            elif "title" in item:
+                title_parts = item["title"]
+                if title_parts:
+                    title = "".join(
+                        [part.get("plain_text", "") for part in title_parts]
+                    )
+        elif item_type == "database":
+            if "title" in item:
+                title_parts = item["title"]
+                if title_parts:
+                    title = "".join(
+                        [part.get("plain_text", "") for part in title_parts]
+                    )
 
-        return "\n\n".join(output)
+        url = item.get("url", "No URL")
+        last_edited = item.get("last_edited_time", "Unknown")
+
+        output.append(
+            f"- {title} ({item_type})\n  ID: {item_id}\n  URL: {url}\n  Last Edited: {last_edited}"
+        )
+
+    # Surface the cursor so the caller can page through the rest instead
+    # of us buffering the whole workspace in one response
+    if data.get("has_more") and data.get("next_cursor"):
+        output.append(f"next_cursor: {data['next_cursor']}")
+
+    return "\n\n".join(output)
+
+
+# Agents tend to re-read the same page several times in a conversation;
+# a short TTL keeps those hits out of the network entirely while staying
+# fresh enough for interactive editing. Failed fetches are not cached.
+@alru_cache(maxsize=256, ttl=30)
+async def _fetch_page_and_blocks(
+    page_id: str,
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    page_url = f"https://api.notion.com/v1/pages/{page_id}"
+    blocks_url = f"https://api.notion.com/v1/blocks/{page_id}/children"
+
+    # Page metadata and block children are independent endpoints, so fetch
+    # them concurrently instead of paying two serial round-trips.
+    # return_exceptions=True settles both tasks before we re-raise, so a
+    # failure on one side never leaves the other's exception unretrieved
+    # or its request still running after we've returned
+    page_resp, blocks_resp = await asyncio.gather(
+        _client.get(page_url, headers=get_headers()),
+        _client.get(blocks_url, headers=get_headers()),
+        return_exceptions=True,
+    )
+    for resp in (page_resp, blocks_resp):
+        if isinstance(resp, BaseException):
+            raise resp
+    return _parse(page_resp), _parse(blocks_resp)
 
 
 @mcp.tool()
 async def get_page_content(page_id: str, ctx: Context = None) -> str:
-    logger.info("get_page_content", page_id)
+    logger.info("get_page_content %s", page_id)
     # Check for API key
     check_api_key(ctx)
     """
     Get the content of a specific Notion page.
-    
+
     Args:
         page_id: The ID of the Notion page to retrieve
-    
+
     Returns:
         A formatted string with the page content
     """
-    # First, get page metadata
-    page_url = f"https://api.notion.com/v1/pages/{page_id}"
-
-    async with httpx.AsyncClient() as client:
-        # Get page metadata
-        response = await client.get(page_url, headers=get_headers())
-
-        if response.status_code != 200:
-            return f"Error retrieving page: {response.status_code} - {response.text}"
-
-        page_data = response.json()
-
-        # Get page blocks (content)
-        blocks_url = f"https://api.notion.com/v1/blocks/{page_id}/children"
-        response = await client.get(blocks_url, headers=get_headers())
-
-        if response.status_code != 200:
-            return f"Error retrieving page content: {response.status_code} - {response.text}"
-
-        blocks_data = response.json()
-
-        # Format the page data
-        output = []
-
-        # Add page title/metadata
-        page_title = "Untitled"
-        if "properties" in page_data:
-            title_prop = page_data["properties"].get("title") or page_data[
-                "properties"
-            ].get("Name")
-            if title_prop and "title" in title_prop:
-                title_parts = title_prop["title"]
-                if title_parts:
-                    page_title = "".join(
-                        [part.get("plain_text", "") for part in title_parts]
-                    )
-
-        output.append(f"# {page_title}")
-        output.append(f"Page ID: {page_data.get('id')}")
-        output.append(f"URL: {page_data.get('url')}")
-        output.append(f"Last Edited: {page_data.get('last_edited_time')}")
-        output.append("\n## Content:\n")
+    try:
+        page_data, blocks_data = await _fetch_page_and_blocks(page_id)
+    except httpx.HTTPStatusError as e:
+        what = "page" if "/pages/" in str(e.request.url) else "page content"
+        return f"Error retrieving {what}: {e.response.status_code} - {e.response.text}"
+
+    # Format the page data into one growing buffer rather than a list of
+    # interim strings joined at the end
+    buf = io.StringIO()
+    w = buf.write
+
+    # Add page title/metadata
+    page_title = "Untitled"
+    if "properties" in page_data:
+        title_prop = page_data["properties"].get("title") or page_data[
+            "properties"
+        ].get("Name")
+        if title_prop and "title" in title_prop:
+            title_parts = title_prop["title"]
+            if title_parts:
+                page_title = "".join(
+                    [part.get("plain_text", "") for part in title_parts]
+                )
+
+    w(f"# {page_title}\n")
+    w(f"Page ID: {page_data.get('id')}\n")
+    w(f"URL: {page_data.get('url')}\n")
+    w(f"Last Edited: {page_data.get('last_edited_time')}\n")
+    w("\n## Content:\n\n")
+
+    # Process all top-level blocks concurrently — each may need its own
+    # children fetch, so gathering them overlaps those round-trips. The
+    # semaphore bounds the total fan-out to stay within Notion's rate limit
+    sem = asyncio.Semaphore(8)
+    block_texts = await asyncio.gather(
+        *(
+            format_block(block, client=_client, sem=sem)
+            for block in blocks_data.get("results", [])
+        )
+    )
+    for block_content in block_texts:
+        if block_content:
+            w(block_content)
+            w("\n")
 
-        # Process blocks
-        for block in blocks_data.get("results", []):
-            block_content = await format_block(block)
-            if block_content:
-                output.append(block_content)
+    return buf.getvalue()
 
-        return "\n".join(output)
 
+async def format_block(
+    block: Dict[str, Any],
+    indent: int = 0,
+    client: Optional[httpx.AsyncClient] = None,
+    sem: Optional[asyncio.Semaphore] = None,
+    max_depth: int = 3,
+) -> str:
+    """Format a Notion block into readable text.
 
-async def format_block(block: Dict[str, Any], indent: int = 0) -> str:
-    """Format a Notion block into readable text"""
-    block_type = block.get("type")
+    Rendering of the block itself happens in block_format (pure Python,
+    mypyc-compilable); this wrapper handles the I/O. When a client and
+    semaphore are provided, child blocks are fetched and formatted
+    recursively (in parallel across siblings) up to max_depth levels;
+    otherwise a placeholder is emitted as before.
+    """
     block_id = block.get("id")
     has_children = block.get("has_children", False)
 
-    indent_str = "  " * indent
-    result = []
-
-    if not block_type or block_type not in block:
-        return f"{indent_str}[Unsupported block type: {block_type}]"
-
-    content = block[block_type]
-
-    # Handle different block types
-    if block_type == "paragraph":
-        text = "".join(
-            [
-                text_item.get("plain_text", "")
-                for text_item in content.get("rich_text", [])
-            ]
-        )
-        result.append(f"{indent_str}{text}")
-
-    elif block_type == "heading_1":
-        text = "".join(
-            [
-                text_item.get("plain_text", "")
-                for text_item in content.get("rich_text", [])
-            ]
-        )
-        result.append(f"{indent_str}# {text}")
-
-    elif block_type == "heading_2":
-        text = "".join(
-            [
-                text_item.get("plain_text", "")
-                for text_item in content.get("rich_text", [])
-            ]
-        )
-        result.append(f"{indent_str}## {text}")
-
-    elif block_type == "heading_3":
-        text = "".join(
-            [
-                text_item.get("plain_text", "")
-                for text_item in content.get("rich_text", [])
-            ]
-        )
-        result.append(f"{indent_str}### {text}")
-
-    elif block_type == "bulleted_list_item":
-        text = "".join(
-            [
-                text_item.get("plain_text", "")
-                for text_item in content.get("rich_text", [])
-            ]
-        )
-        result.append(f"{indent_str}• {text}")
-
-    elif block_type == "numbered_list_item":
-        text = "".join(
-            [
-                text_item.get("plain_text", "")
-                for text_item in content.get("rich_text", [])
-            ]
-        )
-        result.append(
-            f"{indent_str}1. {text}"
-        )  # Simplified, won't have proper numbering
-
-    elif block_type == "to_do":
-        text = "".join(
-            [
-                text_item.get("plain_text", "")
-                for text_item in content.get("rich_text", [])
-            ]
-        )
-        checked = "✓" if content.get("checked", False) else "☐"
-        result.append(f"{indent_str}{checked} {text}")
-
-    elif block_type == "toggle":
-        text = "".join(
-            [
-                text_item.get("plain_text", "")
-                for text_item in content.get("rich_text", [])
-            ]
-        )
-        result.append(f"{indent_str}▶ {text}")
-
-    elif block_type == "code":
-        text = "".join(
-            [
-                text_item.get("plain_text", "")
-                for text_item in content.get("rich_text", [])
-            ]
-        )
-        language = content.get("language", "")
-        result.append(f"{indent_str}```{language}\n{indent_str}{text}\n{indent_str}```")
-
-    elif block_type == "image":
-        caption = "".join(
-            [
-                text_item.get("plain_text", "")
-                for text_item in content.get("caption", [])
-            ]
-        )
-        url = ""
-        if "file" in content:
-            url = content["file"].get("url", "")
-        elif "external" in content:
-            url = content["external"].get("url", "")
-
-        caption_text = f" - {caption}" if caption else ""
-        result.append(f"{indent_str}[Image{caption_text}]({url})")
-
-    elif block_type == "divider":
-        result.append(f"{indent_str}---")
-
-    elif block_type == "callout":
-        text = "".join(
-            [
-                text_item.get("plain_text", "")
-                for text_item in content.get("rich_text", [])
-            ]
-        )
-        emoji = content.get("icon", {}).get("emoji", "")
-        result.append(f"{indent_str}{emoji} | {text}")
-
-    elif block_type == "quote":
-        text = "".join(
-            [
-                text_item.get("plain_text", "")
-                for text_item in content.get("rich_text", [])
-            ]
-        )
-        result.append(f"{indent_str}> {text}")
-
-    elif block_type == "table":
-        result.append(f"{indent_str}[Table - use get_table_content to view]")
+    result = [format_block_text(block, indent)]
 
-    else:
-        result.append(f"{indent_str}[{block_type} block]")
-
-    # If the block has children, we'd need to make another API call to get them
+    # Expand children inline when we have a client to fetch them with,
+    # fanning out across siblings; the semaphore keeps the request burst
+    # within Notion's rate limit
     if has_children:
-        result.append(
-            f"{indent_str}[This block has child blocks that aren't displayed here]"
-        )
+        indent_str = indent_str_for(indent)
+        if client is not None and sem is not None and indent < max_depth:
+            try:
+                async with sem:
+                    response = await client.get(
+                        f"https://api.notion.com/v1/blocks/{block_id}/children",
+                        headers=get_headers(),
+                    )
+                children = _parse(response).get("results", [])
+                child_texts = await asyncio.gather(
+                    *(
+                        format_block(child, indent + 1, client, sem, max_depth)
+                        for child in children
+                    )
+                )
+                result.extend(text for text in child_texts if text)
+            except httpx.HTTPStatusError as e:
+                result.append(
+                    f"{indent_str}[Error retrieving child blocks: {e.response.status_code}]"
+                )
+        else:
+            result.append(
+                f"{indent_str}[This block has child blocks that aren't displayed here]"
+            )
 
     return "\n".join(result)
 
 
+def _extract_date(prop_data: Dict[str, Any]) -> str:
+    date_obj = prop_data.get("date")
+    if not date_obj:
+        return "N/A"
+    start = date_obj.get("start", "")
+    end = date_obj.get("end", "")
+    return f"{start} to {end}" if end else start
+
+
+# One extractor per property type, resolved with a single dict lookup
+# instead of an elif cascade per property per entry
+_PROP_EXTRACTORS = {
+    "title": lambda d: join_rich_text(d, "title"),
+    "rich_text": lambda d: join_rich_text(d),
+    "number": lambda d: d.get("number", "N/A"),
+    "select": lambda d: (d.get("select") or {}).get("name", ""),
+    "multi_select": lambda d: ", ".join(
+        option.get("name", "") for option in d.get("multi_select", ())
+    ),
+    "date": _extract_date,
+    "checkbox": lambda d: "✓" if d.get("checkbox") else "☐",
+    "url": lambda d: d.get("url") or "N/A",
+    "email": lambda d: d.get("email") or "N/A",
+    "phone_number": lambda d: d.get("phone_number") or "N/A",
+}
+
+
 @mcp.tool()
 async def get_database_content(
-    database_id: str, max_pages: int = 10, ctx: Context = None
+    database_id: str,
+    max_pages: int = 10,
+    cursor: Optional[str] = None,
+    ctx: Context = None,
 ) -> str:
     # Check for API key
     check_api_key(ctx)
     """
     Get the content of a Notion database.
-    
+
     Args:
         database_id: The ID of the Notion database to retrieve
         max_pages: Maximum number of pages to return from the database
-    
+        cursor: Optional pagination cursor from a previous call's next_cursor line
+
     Returns:
         A formatted string with the database structure and entries
     """
     database_url = f"https://api.notion.com/v1/databases/{database_id}"
     query_url = f"https://api.notion.com/v1/databases/{database_id}/query"
 
-    async with httpx.AsyncClient() as client:
-        # Get database metadata
-        response = await client.get(database_url, headers=get_headers())
+    # Get database metadata
+    try:
+        response = await _client.get(database_url, headers=get_headers())
+    except httpx.HTTPStatusError as e:
+        return f"Error retrieving database: {e.response.status_code} - {e.response.text}"
 
-        if response.status_code != 200:
-            return (
-                f"Error retrieving database: {response.status_code} - {response.text}"
-            )
-
-        db_data = response.json()
+    db_data = _parse(response)
 
-        # Query database entries
-        payload = {
-            "page_size": min(max_pages, 100)  # Maximum 100 per request
-        }
+    # Query database entries
+    payload = {
+        "page_size": min(max_pages, 100)  # Maximum 100 per request
+    }
+    if cursor:
+        payload["start_cursor"] = cursor
 
-        response = await client.post(query_url, headers=get_headers(), json=payload)
+    try:
+        response = await _client.post(
+            query_url, headers=get_headers(), content=orjson.dumps(payload)
+        )
+    except httpx.HTTPStatusError as e:
+        return f"Error querying database: {e.response.status_code} - {e.response.text}"
 
-        if response.status_code != 200:
-            return f"Error querying database: {response.status_code} - {response.text}"
+    query_data = _parse(response)
+    entries = query_data.get("results", [])
 
-        query_data = response.json()
+    # Notion caps page_size at 100, so keep following the cursor until we
+    # have max_pages entries or the database is exhausted. Cursor paging is
+    # inherently serial, but the pooled client avoids per-request handshakes
+    while query_data.get("has_more") and len(entries) < max_pages:
+        payload = {
+            "page_size": min(100, max_pages - len(entries)),
+            "start_cursor": query_data["next_cursor"],
+        }
+        try:
+            response = await _client.post(
+                query_url, headers=get_headers(), content=orjson.dumps(payload)
+            )
+        except httpx.HTTPStatusError as e:
+            return f"Error querying database: {e.response.status_code} - {e.response.text}"
+        query_data = _parse(response)
+        entries.extend(query_data.get("results", []))
+
+    # Format the database data into one growing buffer
+    buf = io.StringIO()
+    w = buf.write
+
+    # Add database title/metadata
+    db_title = "Untitled Database"
+    if "title" in db_data:
+        title_parts = db_data["title"]
+        if title_parts:
+            db_title = "".join([part.get("plain_text", "") for part in title_parts])
+
+    w(f"# {db_title}\n")
+    w(f"Database ID: {db_data.get('id')}\n")
+    w(f"URL: {db_data.get('url')}\n")
+
+    # Add database properties/schema
+    w("\n## Database Schema:\n")
+    for prop_name, prop_data in db_data.get("properties", {}).items():
+        prop_type = prop_data.get("type", "unknown")
+        w(f"- {prop_name}: {prop_type}\n")
+
+    # Add database entries
+    w(f"\n## Database Entries ({len(entries)}):\n")
+
+    for i, entry in enumerate(entries, 1):
+        w(f"\n### Entry {i}\n")
+        w(f"ID: {entry.get('id')}\n")
+        w(f"URL: {entry.get('url')}\n")
+
+        # Extract and format properties
+        properties = entry.get("properties", {})
+        for prop_name, prop_data in properties.items():
+            prop_type = prop_data.get("type", "unknown")
 
-        # Format the database data
-        output = []
+            # Extract property value based on type via the dispatch table
+            fn = _PROP_EXTRACTORS.get(prop_type)
+            prop_value = fn(prop_data) if fn else "N/A"
 
-        # Add database title/metadata
-        db_title = "Untitled Database"
-        if "title" in db_data:
-            title_parts = db_data["title"]
-            if title_parts:
-                db_title = "".join([part.get("plain_text", "") for part in title_parts])
+            w(f"- {prop_name}: {prop_value}\n")
 
-        output.append(f"# {db_title}")
-        output.append(f"Database ID: {db_data.get('id')}")
-        output.append(f"URL: {db_data.get('url')}")
+    # Surface the cursor so the caller can page through remaining entries
+    if query_data.get("has_more") and query_data.get("next_cursor"):
+        w(f"\nnext_cursor: {query_data['next_cursor']}\n")
 
-        # Add database properties/schema
-        output.append("\n## Database Schema:")
-        for prop_name, prop_data in db_data.get("properties", {}).items():
-            prop_type = prop_data.get("type", "unknown")
-            output.append(f"- {prop_name}: {prop_type}")
-
-        # Add database entries
-        entries = query_data.get("results", [])
-        output.append(f"\n## Database Entries ({len(entries)}):")
-
-        for i, entry in enumerate(entries, 1):
-            output.append(f"\n### Entry {i}")
-            output.append(f"ID: {entry.get('id')}")
-            output.append(f"URL: {entry.get('url')}")
-
-            # Extract and format properties
-            properties = entry.get("properties", {})
-            for prop_name, prop_data in properties.items():
-                prop_type = prop_data.get("type", "unknown")
-
-                # Extract property value based on type
-                prop_value = "N/A"
-                if prop_type == "title" and "title" in prop_data:
-                    title_parts = prop_data["title"]
-                    prop_value = "".join(
-                        [part.get("plain_text", "") for part in title_parts]
-                    )
-                elif prop_type == "rich_text" and "rich_text" in prop_data:
-                    text_parts = prop_data["rich_text"]
-                    prop_value = "".join(
-                        [part.get("plain_text", "") for part in text_parts]
-                    )
-                elif prop_type == "number" and "number" in prop_data:
-                    prop_value = prop_data["number"]
-                elif (
-                    prop_type == "select"
-                    and "select" in prop_data
-                    and prop_data["select"]
-                ):
-                    prop_value = prop_data["select"].get("name", "")
-                elif prop_type == "multi_select" and "multi_select" in prop_data:
-                    options = prop_data["multi_select"]
-                    prop_value = ", ".join(
-                        [option.get("name", "") for option in options]
-                    )
-                elif prop_type == "date" and "date" in prop_data and prop_data["date"]:
-                    date_obj = prop_data["date"]
-                    start = date_obj.get("start", "")
-                    end = date_obj.get("end", "")
-                    prop_value = start
-                    if end:
-                        prop_value += f" to {end}"
-                elif prop_type == "checkbox" and "checkbox" in prop_data:
-                    prop_value = "✓" if prop_data["checkbox"] else "☐"
-                elif prop_type == "url" and "url" in prop_data:
-                    prop_value = prop_data["url"] or "N/A"
-                elif prop_type == "email" and "email" in prop_data:
-                    prop_value = prop_data["email"] or "N/A"
-                elif prop_type == "phone_number" and "phone_number" in prop_data:
-                    prop_value = prop_data["phone_number"] or "N/A"
-
-                output.append(f"- {prop_name}: {prop_value}")
-
-        return "\n".join(output)
+    return buf.getvalue()
 
 
 @mcp.tool()
@@ -488,26 +548,25 @@ async def get_block_children(block_id: str, ctx: Context = None) -> str:
     """
     url = f"https://api.notion.com/v1/blocks/{block_id}/children"
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=get_headers())
-
-        if response.status_code != 200:
-            return f"Error retrieving block children: {response.status_code} - {response.text}"
+    try:
+        response = await _client.get(url, headers=get_headers())
+    except httpx.HTTPStatusError as e:
+        return f"Error retrieving block children: {e.response.status_code} - {e.response.text}"
 
-        data = response.json()
-        results = data.get("results", [])
+    data = _parse(response)
+    results = data.get("results", [])
 
-        if not results:
-            return "This block has no children."
+    if not results:
+        return "This block has no children."
 
-        # Format the results
-        output = []
-        for block in results:
-            block_content = await format_block(block)
-            if block_content:
-                output.append(block_content)
+    # Format all sibling blocks concurrently, expanding nested children
+    # via the shared client
+    sem = asyncio.Semaphore(8)
+    block_texts = await asyncio.gather(
+        *(format_block(block, client=_client, sem=sem) for block in results)
+    )
 
-        return "\n".join(output)
+    return "\n".join(text for text in block_texts if text)
 
 
 if __name__ == "__main__":